@@ -3,8 +3,9 @@ import os
 from dotenv import load_dotenv
 from modules.assemblyai_stream import AssemblyAIStreamer
 from modules.interview_flow import InterviewFlow
+from modules.follow_up import FollowUpEngine
 from modules.storage import save_transcript, save_report
-from main import generate_intro_and_questions, generate_conclusion, evaluate_candidate
+from main import generate_intro_and_questions, generate_conclusion, evaluate_candidate, generate_follow_up
 from streamlit_webrtc import webrtc_streamer, WebRtcMode, VideoProcessorBase, RTCConfiguration
 import json
 import threading
@@ -157,6 +158,8 @@ if 'streamer' not in st.session_state: st.session_state.streamer = AssemblyAIStr
 if 'webrtc_ctx' not in st.session_state: st.session_state.webrtc_ctx = None
 if 'interview_flow_initialized' not in st.session_state: st.session_state.interview_flow_initialized = False
 if 'show_questions' not in st.session_state: st.session_state.show_questions = False
+if 'follow_up_engine' not in st.session_state: st.session_state.follow_up_engine = None
+if 'follow_up_indices' not in st.session_state: st.session_state.follow_up_indices = set()
 
 
 # A simple video processor to handle video recording
@@ -195,6 +198,12 @@ def interview_page():
                 st.session_state.questions = [line.strip() for line in intro_and_questions_text.strip().split('\n') if line.strip()]
                 st.session_state.conclusion_text = generate_conclusion(role_title, role_description)
             
+            role_title = st.session_state.role_title
+            role_description = st.session_state.role_description
+            st.session_state.follow_up_engine = FollowUpEngine(
+                lambda question, answer, is_stale: generate_follow_up(role_title, role_description, question, answer, is_stale)
+            )
+            st.session_state.follow_up_indices = set()
             st.session_state.interview_flow_initialized = True
             st.session_state.current_question_index = 0
             st.experimental_rerun()
@@ -219,7 +228,12 @@ def interview_page():
         st.markdown('</div>', unsafe_allow_html=True)
 
         if webrtc_ctx.state.playing and st.session_state.interview_flow_initialized:
-            interview = InterviewFlow(st.session_state.questions, st.session_state.conclusion_text)
+            interview = InterviewFlow(
+                st.session_state.questions,
+                st.session_state.conclusion_text,
+                follow_up_engine=st.session_state.follow_up_engine,
+                follow_up_indices=st.session_state.follow_up_indices,
+            )
             interview.index = st.session_state.current_question_index
             
             # Start streamer only once the webrtc component is confirmed to be playing
@@ -237,6 +251,7 @@ def interview_page():
                 # Check for special phrases and update interview flow
                 interview.check_for_commands(latest_transcript.lower(), st.session_state.current_question_index)
                 if interview.advance_to_next_question:
+                    interview.insert_follow_up()
                     st.session_state.current_question_index += 1
                     st.session_state.full_transcript += f"Bot: {interview.current_question()}\n"
                     interview.advance_to_next_question = False
@@ -245,6 +260,9 @@ def interview_page():
                     bot_placeholder.markdown(f"**Bot:** Are you sure for going to next question?")
                     st.session_state.full_transcript += f"Bot: Are you sure for going to next question?\n"
                     interview.confirmation_needed = False
+                else:
+                    # Keep a follow-up warm while the candidate is still answering
+                    interview.record_answer(latest_transcript)
 
             # Display current bot question
             with bot_placeholder:
@@ -263,15 +281,18 @@ def interview_page():
                 elif interview.is_over():
                     st.markdown(f"<div style='text-align: center; font-size: 1.5rem;'><b>Bot:</b> {interview.conclusion_text}</div>", unsafe_allow_html=True)
                     st.session_state.streamer.stop()
+                    st.session_state.follow_up_engine.cancel()
                     st.session_state.page = "post_interview"
                     st.experimental_rerun()
                 elif st.session_state.current_question_index >= len(st.session_state.questions) - 1:
                     if st.button("End Interview"):
+                        st.session_state.follow_up_engine.cancel()
                         st.session_state.interview_started = False
                         st.session_state.page = "post_interview"
                         st.experimental_rerun()
                 else:
                     if st.button("Next Question"):
+                        interview.insert_follow_up()
                         st.session_state.current_question_index += 1
                         st.experimental_rerun()
 
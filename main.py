@@ -1,4 +1,5 @@
 import os
+from typing import Callable
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -68,3 +69,35 @@ Summarize the candidate's performance and provide a JSON object with:
         ],
     )
     return safe_get_response_content(response)
+
+def generate_follow_up(role_title: str, role_description: str, question: str, answer_so_far: str, is_stale: Callable[[], bool] | None = None) -> str | None:
+    prompt = f"""
+You are an AI interviewer for the {role_title} role.
+Role Description: {role_description}
+Question: {question}
+Candidate's answer so far: {answer_so_far}
+
+Ask exactly one short follow-up question based on the candidate's answer.
+Return only the question.
+"""
+    if is_stale and is_stale():
+        return None
+    stream = client.chat.completions.create(
+        model="llama3-70b-8192",
+        temperature=0.7,
+        max_tokens=80,
+        stream=True,
+        messages=[
+            {"role": "system", "content": "You are an expert interviewer."},
+            {"role": "user", "content": prompt}
+        ],
+    )
+    parts = []
+    for chunk in stream:
+        # Stop paying for tokens as soon as the answer has moved on.
+        if is_stale and is_stale():
+            stream.close()
+            return None
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+    return "".join(parts).strip() or None
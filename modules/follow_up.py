@@ -0,0 +1,81 @@
+import threading
+
+
+class FollowUpEngine:
+    def __init__(self, generate_fn, debounce=0.5):
+        """
+        generate_fn: callable(question, answer_so_far, is_stale) -> str or None
+            Runs on a background thread. It should poll is_stale() and
+            abandon the LLM call as soon as it returns True.
+        debounce: float
+            Seconds to wait after the latest transcript segment before
+            starting a call, so quick bursts of speech only cost one request.
+        """
+        self.generate_fn = generate_fn
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._question_index = None
+        self._answer_parts = []
+        self._timer = None
+        self._follow_up = None
+
+    def _reset(self, question_index=None):
+        """Drops the current answer and invalidates any pending or running call."""
+        self._generation += 1
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._question_index = question_index
+        self._answer_parts = []
+        self._follow_up = None
+
+    def feed(self, question_index, question, transcript):
+        """
+        Adds a transcript segment to the answer for the given question and
+        schedules a fresh speculative follow-up. Any older call is now stale.
+        """
+        with self._lock:
+            if question_index != self._question_index:
+                self._reset(question_index)
+            self._answer_parts.append(transcript)
+            self._generation += 1
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(
+                self.debounce,
+                self._run,
+                args=(self._generation, question, " ".join(self._answer_parts)),
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self, generation, question, answer):
+        def is_stale():
+            return generation != self._generation
+
+        if is_stale():
+            return
+        try:
+            follow_up = self.generate_fn(question, answer, is_stale)
+        except Exception as e:
+            print(f"Error generating follow-up: {e}")
+            return
+        with self._lock:
+            if follow_up and not is_stale():
+                self._follow_up = follow_up
+
+    def take(self, question_index):
+        """
+        Returns the latest ready follow-up for the given question without
+        blocking, or None if nothing is ready, and clears the engine.
+        """
+        with self._lock:
+            follow_up = self._follow_up if question_index == self._question_index else None
+            self._reset()
+            return follow_up
+
+    def cancel(self):
+        """Cancels any pending or running speculative call."""
+        with self._lock:
+            self._reset()
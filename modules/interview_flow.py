@@ -1,12 +1,23 @@
+READY_FOR_QUESTIONS = "i am ready for questions"
+READY_FOR_NEXT_QUESTION = "i am ready for next question"
+CONFIRMATION = "yes please"
+COMMAND_PHRASES = (READY_FOR_QUESTIONS, READY_FOR_NEXT_QUESTION, CONFIRMATION)
+
+
 class InterviewFlow:
-    def __init__(self, questions, conclusion_text):
+    def __init__(self, questions, conclusion_text, follow_up_engine=None, follow_up_indices=None):
         """
         questions: List of strings
             [greeting, profile, q1, q2, ..., q6]
+            Follow-up questions are inserted into this list in place.
         conclusion_text: str
+        follow_up_engine: FollowUpEngine or None
+        follow_up_indices: Set of question indices that are follow-ups
         """
         self.questions = questions
         self.conclusion_text = conclusion_text
+        self.follow_up_engine = follow_up_engine
+        self.follow_up_indices = follow_up_indices if follow_up_indices is not None else set()
         self.index = 0  # Current question index
         self.advance_to_next_question = False
         self.confirmation_needed = False
@@ -22,15 +33,44 @@ class InterviewFlow:
         # So we check if the index has passed the last question.
         return self.index >= len(self.questions)
 
+    def record_answer(self, transcript: str):
+        """
+        Feeds a segment of the candidate's answer to the follow-up engine.
+        Command phrases and answers to follow-ups are not tracked.
+        """
+        if self.follow_up_engine is None:
+            return
+        if self.index < 1 or self.index >= len(self.questions) - 1:
+            return
+        if self.index in self.follow_up_indices:
+            return
+        if any(phrase in transcript.lower() for phrase in COMMAND_PHRASES):
+            return
+        self.follow_up_engine.feed(self.index, self.current_question(), transcript)
+
+    def insert_follow_up(self):
+        """
+        Inserts the speculative follow-up, if one is ready, right after the
+        current question. Never waits on the LLM.
+        """
+        if self.follow_up_engine is None:
+            return None
+        follow_up = self.follow_up_engine.take(self.index)
+        if follow_up:
+            self.questions.insert(self.index + 1, follow_up)
+            self.follow_up_indices.add(self.index + 1)
+        return follow_up
+
     def check_for_commands(self, transcript_lower: str, current_index: int):
         """
-        Checks for special phrases to advance the interview state.
+        Checks for special phrases and sets the advance/confirmation flags.
+        The caller advances the index and inserts any follow-up.
         """
-        if current_index == 1 and "i am ready for questions" in transcript_lower:
+        if current_index == 1 and READY_FOR_QUESTIONS in transcript_lower:
             self.advance_to_next_question = True
         elif current_index > 1 and current_index < len(self.questions) - 1:
-            if "i am ready for next question" in transcript_lower:
+            if READY_FOR_NEXT_QUESTION in transcript_lower:
                 self.confirmation_needed = True
-            elif self.confirmation_needed and "yes please" in transcript_lower:
+            elif self.confirmation_needed and CONFIRMATION in transcript_lower:
                 self.advance_to_next_question = True
                 self.confirmation_needed = False